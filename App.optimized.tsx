@@ -7,13 +7,14 @@ import React, { useState, useCallback, useEffect, Suspense, lazy } from 'react';
 import { DocumentTypeProvider, useDocumentType } from './components/DocumentTypeContext';
 import { ParsedTransaction } from './types';
 import { parseStatementWithLLM } from './services/llmService';
-import { processFileWithOCR } from './services/ocrService';
+import { processFileWithOCR, warmUpOCR } from './services/ocrService';
 import { parseOCRText } from './services/ocrParser';
 import { LLMProvider } from './services/llmService';
 import { APP_TITLE, ACCEPTED_FILE_TYPES } from './constants';
 import Spinner from './components/Spinner';
 import ErrorBoundary from './components/ErrorBoundary';
 import { logger } from './services/logger';
+import { readFileAsDataURL } from './utils/fileUtils';
 
 // Lazy load heavy components
 const FileUpload = lazy(() => import('./components/FileUpload'));
@@ -109,6 +110,12 @@ const AppContent: React.FC = () => {
   const handleSelectParsingOption = useCallback((option: LLMProvider | 'ocr') => {
     setParsingMethod(option);
     setError(null);
+
+    // Load the OCR engine while the user is still picking a file
+    if (option === 'ocr') {
+      warmUpOCR();
+    }
+
     if (selectedFile) {
       setExtractedTransactions([]);
     }
@@ -188,12 +195,7 @@ const AppContent: React.FC = () => {
 
         // Read file based on type
         if (mimeType.startsWith('image/') || mimeType === 'application/pdf') {
-          fileContent = await new Promise((resolve, reject) => {
-            const reader = new FileReader();
-            reader.onload = () => resolve((reader.result as string).split(',')[1]);
-            reader.onerror = error => reject(error);
-            reader.readAsDataURL(selectedFile);
-          });
+          fileContent = await readFileAsDataURL(selectedFile);
         } else if (mimeType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document') {
           const arrayBuffer = await selectedFile.arrayBuffer();
           const result = await mammoth.extractRawText({ arrayBuffer });
@@ -8,10 +8,11 @@ import GeminiApiModal from './components/GeminiApiModal';
 import { DocumentTypeProvider, useDocumentType } from './components/DocumentTypeContext';
 import { ParsedTransaction } from './types';
 import { parseStatementWithLLM } from './services/llmService';
-import { processFileWithOCR } from './services/ocrService';
+import { processFileWithOCR, warmUpOCR } from './services/ocrService';
 import { parseOCRText } from './services/ocrParser';
 import { LLMProvider } from './services/llmService';
 import { APP_TITLE, ACCEPTED_FILE_TYPES } from './constants';
+import { readFileAsDataURL } from './utils/fileUtils';
 
 // For mammoth, we rely on the global mammoth object from the CDN script
 declare var mammoth: any;
@@ -84,6 +85,11 @@ const AppContent: React.FC = () => {
     setParsingMethod(option);
     setError(null);
 
+    // Load the OCR engine while the user is still picking a file
+    if (option === 'ocr') {
+      warmUpOCR();
+    }
+
     // Reset other states when changing parsing method
     if (selectedFile) {
       setExtractedTransactions([]);
@@ -163,12 +169,7 @@ const AppContent: React.FC = () => {
         }
 
         if (mimeType.startsWith('image/') || mimeType === 'application/pdf') {
-          fileContent = await new Promise((resolve, reject) => {
-            const reader = new FileReader();
-            reader.onload = () => resolve((reader.result as string).split(',')[1]);
-            reader.onerror = error => reject(error);
-            reader.readAsDataURL(selectedFile);
-          });
+          fileContent = await readFileAsDataURL(selectedFile);
         } else if (mimeType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document') {
           const arrayBuffer = await selectedFile.arrayBuffer();
           const result = await mammoth.extractRawText({ arrayBuffer });
@@ -9,6 +9,9 @@ import {
   GEMINI_PROMPT_FOR_FILE 
 } from '../constants';
 
+// Matches a Markdown code fence wrapped around the JSON payload
+const JSON_FENCE_PATTERN = /^```(?:json)?\s*\n?(.*?)\n?\s*```$/s;
+
 // Get API key from local storage only
 const getApiKey = (): string | null => {
   // Get API key from local storage
@@ -20,15 +23,19 @@ export const setApiKey = (key: string): void => {
   localStorage.setItem('gemini_api_key', key);
 };
 
-// Create a configurable instance of the Google Generative AI client
+// Create a configurable instance of the Google Generative AI client, reused while the key is unchanged
+let cachedClient: { apiKey: string; client: GoogleGenAI } | null = null;
+
 const createAIClient = (apiKey: string) => {
-  return new GoogleGenAI({ apiKey });
+  if (!cachedClient || cachedClient.apiKey !== apiKey) {
+    cachedClient = { apiKey, client: new GoogleGenAI({ apiKey }) };
+  }
+  return cachedClient.client;
 };
 
 const parseJsonFromText = (text: string): ParsedTransaction[] | null => {
   let jsonStr = text.trim();
-  const fenceRegex = /^```(?:json)?\s*\n?(.*?)\n?\s*```$/s;
-  const match = jsonStr.match(fenceRegex);
+  const match = jsonStr.match(JSON_FENCE_PATTERN);
   if (match && match[1]) {
     jsonStr = match[1].trim();
   }
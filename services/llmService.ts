@@ -22,6 +22,12 @@ export interface LLMResponse {
   rawResponse?: any;
 }
 
+// Matches a Markdown code fence wrapped around the JSON payload
+const JSON_FENCE_PATTERN = /^```(?:json)?\s*\n?(.*?)\n?\s*```$/s;
+
+// Only the most recent key's client is kept, so a replaced key is not held onto
+let geminiClient: { apiKey: string; client: GoogleGenAI } | null = null;
+
 // Provider-specific configurations
 const PROVIDER_CONFIGS = {
   gemini: {
@@ -86,6 +92,37 @@ export function validateApiKey(provider: LLMProvider, apiKey: string): boolean {
   }
 }
 
+/**
+ * Build request headers for the OpenAI REST API
+ */
+function buildOpenAIHeaders(apiKey: string): Record<string, string> {
+  return {
+    'Authorization': `Bearer ${apiKey}`,
+    'Content-Type': 'application/json'
+  };
+}
+
+/**
+ * Build request headers for the Anthropic REST API
+ */
+function buildAnthropicHeaders(apiKey: string): Record<string, string> {
+  return {
+    'x-api-key': apiKey,
+    'anthropic-version': '2023-06-01',
+    'Content-Type': 'application/json'
+  };
+}
+
+/**
+ * Return a Gemini client for the key, reusing the previous one while the key is unchanged
+ */
+function getGeminiClient(apiKey: string): GoogleGenAI {
+  if (!geminiClient || geminiClient.apiKey !== apiKey) {
+    geminiClient = { apiKey, client: new GoogleGenAI({ apiKey }) };
+  }
+  return geminiClient.client;
+}
+
 /**
  * Test API key validity by making a small request
  */
@@ -93,7 +130,7 @@ export async function testApiKey(config: LLMConfig): Promise<boolean> {
   try {
     switch (config.provider) {
       case 'gemini':
-        const ai = new GoogleGenAI({ apiKey: config.apiKey });
+        const ai = getGeminiClient(config.apiKey);
         await ai.models.generateContent({
           model: 'gemini-1.5-flash',
           contents: { parts: [{ text: 'Hello' }] },
@@ -103,21 +140,14 @@ export async function testApiKey(config: LLMConfig): Promise<boolean> {
 
       case 'openai':
         const openaiResponse = await fetch('https://api.openai.com/v1/models', {
-          headers: {
-            'Authorization': `Bearer ${config.apiKey}`,
-            'Content-Type': 'application/json'
-          }
+          headers: buildOpenAIHeaders(config.apiKey)
         });
         return openaiResponse.ok;
 
       case 'anthropic':
         const anthropicResponse = await fetch('https://api.anthropic.com/v1/messages', {
           method: 'POST',
-          headers: {
-            'x-api-key': config.apiKey,
-            'anthropic-version': '2023-06-01',
-            'Content-Type': 'application/json'
-          },
+          headers: buildAnthropicHeaders(config.apiKey),
           body: JSON.stringify({
             model: 'claude-3-haiku-20240307',
             max_tokens: 10,
@@ -140,8 +170,7 @@ export async function testApiKey(config: LLMConfig): Promise<boolean> {
  */
 function parseJsonFromText(text: string): ParsedTransaction[] | null {
   let jsonStr = text.trim();
-  const fenceRegex = /^```(?:json)?\s*\n?(.*?)\n?\s*```$/s;
-  const match = jsonStr.match(fenceRegex);
+  const match = jsonStr.match(JSON_FENCE_PATTERN);
   if (match && match[1]) {
     jsonStr = match[1].trim();
   }
@@ -228,7 +257,7 @@ async function processWithGemini(
   documentType: 'bank' | 'creditcard' | 'ledger' | null,
   config: LLMConfig
 ): Promise<LLMResponse> {
-  const ai = new GoogleGenAI({ apiKey: config.apiKey });
+  const ai = getGeminiClient(config.apiKey);
 
   const parts: Part[] = [];
 
@@ -307,10 +336,7 @@ async function processWithOpenAI(
 
   const response = await fetch('https://api.openai.com/v1/chat/completions', {
     method: 'POST',
-    headers: {
-      'Authorization': `Bearer ${config.apiKey}`,
-      'Content-Type': 'application/json'
-    },
+    headers: buildOpenAIHeaders(config.apiKey),
     body: JSON.stringify({
       model: config.model,
       messages: messages,
@@ -378,11 +404,7 @@ async function processWithAnthropic(
 
   const response = await fetch('https://api.anthropic.com/v1/messages', {
     method: 'POST',
-    headers: {
-      'x-api-key': config.apiKey,
-      'anthropic-version': '2023-06-01',
-      'Content-Type': 'application/json'
-    },
+    headers: buildAnthropicHeaders(config.apiKey),
     body: JSON.stringify({
       model: config.model,
       system: systemInstruction,
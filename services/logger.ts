@@ -14,6 +14,14 @@ interface LogEntry {
 
 const isDevelopment = import.meta.env.DEV;
 
+// Resolved once at module load rather than on every log call
+const LEVEL_TAGS: Record<LogLevel, string> = {
+  debug: '[DEBUG]',
+  info: '[INFO]',
+  warn: '[WARN]',
+  error: '[ERROR]',
+};
+
 class Logger {
   private logs: LogEntry[] = [];
   private maxLogs = 100;
@@ -68,17 +76,15 @@ class Logger {
     // Console output in development
     if (isDevelopment) {
       const logMethod = console[level] || console.log;
-      const timestamp = entry.timestamp.toISOString();
+      const prefix = `[${entry.timestamp.toISOString()}] ${LEVEL_TAGS[level]} ${message}`;
 
       if (data) {
-        logMethod(`[${timestamp}] [${level.toUpperCase()}] ${message}`, data);
+        logMethod(prefix, data);
       } else {
-        logMethod(`[${timestamp}] [${level.toUpperCase()}] ${message}`);
+        logMethod(prefix);
       }
-    }
-
-    // In production, errors are always logged to console
-    if (level === 'error') {
+    } else if (level === 'error') {
+      // In production, errors are always logged to console
       console.error(`[${entry.timestamp.toISOString()}] ${message}`, data);
     }
   }
@@ -0,0 +1,53 @@
+/**
+ * OCR Result Cache
+ * Small in-memory LRU of extracted text, keyed by upload content and render scale
+ */
+
+export interface CachedOCRResult {
+  text: string;
+  confidence?: number;
+}
+
+// Map iteration follows insertion order, which lets it double as a small LRU
+export const OCR_CACHE_MAX_ENTRIES = 8;
+const ocrResultCache = new Map<string, CachedOCRResult>();
+
+/**
+ * Build the cache key for a content digest; results rendered at different scales can differ
+ */
+export function getOCRCacheKey(digest: string, renderScale: number): string {
+  return `${digest}@${renderScale}`;
+}
+
+/**
+ * Look up a cached OCR result and mark it as most recently used
+ */
+export function getCachedResult(key: string): CachedOCRResult | undefined {
+  const cached = ocrResultCache.get(key);
+  if (cached) {
+    ocrResultCache.delete(key);
+    ocrResultCache.set(key, cached);
+  }
+  return cached;
+}
+
+/**
+ * Store an OCR result, evicting the least recently used entry when full
+ */
+export function cacheResult(key: string, result: CachedOCRResult): void {
+  ocrResultCache.delete(key);
+  ocrResultCache.set(key, result);
+  if (ocrResultCache.size > OCR_CACHE_MAX_ENTRIES) {
+    const oldestKey = ocrResultCache.keys().next().value;
+    if (oldestKey !== undefined) {
+      ocrResultCache.delete(oldestKey);
+    }
+  }
+}
+
+/**
+ * Drop every cached OCR result
+ */
+export function clearOCRCache(): void {
+  ocrResultCache.clear();
+}
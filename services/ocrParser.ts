@@ -2,6 +2,59 @@ import { ParsedTransaction } from '../types';
 import { parseWithTemplateDetection } from './templateParser';
 import logger from './logger';
 
+// Per-row debug output is only worth producing while developing
+const isDevelopment = import.meta.env.DEV;
+
+const BANK_NAME_PATTERNS = [
+  /bank\s+of\s+america/i,
+  /chase/i,
+  /wells\s+fargo/i,
+  /citibank/i,
+  /bank\s+of\s+the\s+west/i,
+  /us\s+bank/i,
+  /pnc/i,
+  /capital\s+one/i,
+  /discover/i,
+  /american\s+express/i
+];
+const CLIENT_NAME_PATTERNS = [
+  /account\s+holder:?\s*([^\n\r]+)/i,
+  /customer:?\s*([^\n\r]+)/i,
+  /client:?\s*([^\n\r]+)/i,
+  /name:?\s*([^\n\r]+)/i
+];
+const STATEMENT_PERIOD_PATTERNS = [
+  /statement\s+(?:period|date):?\s*([^\n\r]+)/i,
+  /from\s+([^\n\r]+?)\s+to\s+([^\n\r]+)/i,
+  /(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[^\n\r]*/i
+];
+// Only the first code is used, so no global flag: matching stops at the first hit
+const CURRENCY_CODE_PATTERN = /\b(USD|EUR|GBP|JPY|CAD|AUD|CHF|CNY|SEK|NZD|MXN|SGD|HKD|NOK|KRW|TRY|RUB|INR|BRL|ZAR)\b/;
+const TRANSACTION_LINE_PATTERNS = [
+  // MM/DD/YYYY or MM/DD/YY followed by description and amount
+  /^(\d{1,2}\/\d{1,2}\/\d{2,4})\s+(.+?)\s+(-?\$?\d{1,3}(?:,\d{3})*\.\d{2}|\$?\d+\.\d{2})$/,
+  // YYYY-MM-DD followed by description and amount
+  /^(\d{4}-\d{2}-\d{2})\s+(.+?)\s+(-?\$?\d{1,3}(?:,\d{3})*\.\d{2}|\$?\d+\.\d{2})$/,
+  // Date, description, amount (more flexible)
+  /(\d{1,2}\/\d{1,2}\/\d{2,4}|\d{4}-\d{2}-\d{2})\s+(.+?)\s+(-?\$?\d+(?:\.\d{2})?|\$?\d+\.\d{2})/
+];
+const GRID_HEADER_PATTERNS = [
+  /date\s+description\s+amount/i,
+  /date\s+transaction\s+amount/i,
+  /date\s+memo\s+amount/i,
+  /posted\s+description\s+amount/i,
+  /trans\s+date\s+description\s+amount/i
+];
+const HEADER_DESCRIPTION_COLUMN_PATTERN = /\b(description|memo|transaction|details)\b/;
+const HEADER_AMOUNT_COLUMN_PATTERN = /\b(amount|debit|credit|balance)\b/;
+const SPACING_DATE_PATTERN = /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/;
+// matchAll requires the global flag; it iterates over a copy, so sharing the constant is safe
+const SPACING_AMOUNT_PATTERN = /[\$]?\d+\.\d{2}\b/g;
+const COLUMN_DATE_PATTERN = /\b(\d{1,2}\/\d{1,2}\/\d{2,4})\b/;
+const COLUMN_AMOUNT_PATTERN = /[\$]?([+-]?\d{1,3}(?:,\d{3})*\.\d{2}|\d+\.\d{2})/;
+// "ending balance" and "beginning balance" are already covered by "balance"
+const SUMMARY_LINE_PATTERN = /total|balance|summary|deposits|withdrawals/i;
+
 /**
  * Parse OCR-extracted text into structured transaction data
  * Uses advanced template detection and machine-readable patterns
@@ -88,20 +141,7 @@ function extractMetadata(text: string): {
   };
 
   // Try to extract bank name
-  const bankPatterns = [
-    /bank\s+of\s+america/i,
-    /chase/i,
-    /wells\s+fargo/i,
-    /citibank/i,
-    /bank\s+of\s+the\s+west/i,
-    /us\s+bank/i,
-    /pnc/i,
-    /capital\s+one/i,
-    /discover/i,
-    /american\s+express/i
-  ];
-
-  for (const pattern of bankPatterns) {
+  for (const pattern of BANK_NAME_PATTERNS) {
     const match = text.match(pattern);
     if (match) {
       metadata.bankName = match[0];
@@ -110,14 +150,7 @@ function extractMetadata(text: string): {
   }
 
   // Try to extract client name (look for patterns after "Account Holder" or similar)
-  const clientPatterns = [
-    /account\s+holder:?\s*([^\n\r]+)/i,
-    /customer:?\s*([^\n\r]+)/i,
-    /client:?\s*([^\n\r]+)/i,
-    /name:?\s*([^\n\r]+)/i
-  ];
-
-  for (const pattern of clientPatterns) {
+  for (const pattern of CLIENT_NAME_PATTERNS) {
     const match = text.match(pattern);
     if (match && match[1]) {
       metadata.clientName = match[1].trim();
@@ -126,13 +159,7 @@ function extractMetadata(text: string): {
   }
 
   // Try to extract statement period
-  const periodPatterns = [
-    /statement\s+(?:period|date):?\s*([^\n\r]+)/i,
-    /from\s+([^\n\r]+?)\s+to\s+([^\n\r]+)/i,
-    /(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[^\n\r]*/i
-  ];
-
-  for (const pattern of periodPatterns) {
+  for (const pattern of STATEMENT_PERIOD_PATTERNS) {
     const match = text.match(pattern);
     if (match) {
       metadata.statementPeriod = match[0].trim();
@@ -141,16 +168,9 @@ function extractMetadata(text: string): {
   }
 
   // Try to extract currency
-  const currencyPatterns = [
-    /\b(USD|EUR|GBP|JPY|CAD|AUD|CHF|CNY|SEK|NZD|MXN|SGD|HKD|NOK|KRW|TRY|RUB|INR|BRL|ZAR)\b/g
-  ];
-
-  for (const pattern of currencyPatterns) {
-    const match = text.match(pattern);
-    if (match) {
-      metadata.currency = match[0];
-      break;
-    }
+  const currencyMatch = text.match(CURRENCY_CODE_PATTERN);
+  if (currencyMatch) {
+    metadata.currency = currencyMatch[0];
   }
 
   return metadata;
@@ -168,7 +188,7 @@ function parseBankStatement(text: string, metadata: any): ParsedTransaction[] {
   console.log(`Processing ${lines.length} lines of text`);
 
   // First, try grid-based parsing (most reliable for structured statements)
-  const gridTransactions = parseGridBased(text, metadata);
+  const gridTransactions = parseGridBased(lines, metadata);
   if (gridTransactions.length > 0) {
     console.log(`Grid-based parsing found ${gridTransactions.length} transactions`);
     return gridTransactions;
@@ -177,17 +197,8 @@ function parseBankStatement(text: string, metadata: any): ParsedTransaction[] {
   console.log('Grid-based parsing failed, falling back to pattern matching');
 
   // Fallback: Look for transaction patterns (original logic)
-  const transactionPatterns = [
-    // MM/DD/YYYY or MM/DD/YY followed by description and amount
-    /^(\d{1,2}\/\d{1,2}\/\d{2,4})\s+(.+?)\s+(-?\$?\d{1,3}(?:,\d{3})*\.\d{2}|\$?\d+\.\d{2})$/,
-    // YYYY-MM-DD followed by description and amount
-    /^(\d{4}-\d{2}-\d{2})\s+(.+?)\s+(-?\$?\d{1,3}(?:,\d{3})*\.\d{2}|\$?\d+\.\d{2})$/,
-    // Date, description, amount (more flexible)
-    /(\d{1,2}\/\d{1,2}\/\d{2,4}|\d{4}-\d{2}-\d{2})\s+(.+?)\s+(-?\$?\d+(?:\.\d{2})?|\$?\d+\.\d{2})/
-  ];
-
   for (const line of lines) {
-    for (const pattern of transactionPatterns) {
+    for (const pattern of TRANSACTION_LINE_PATTERNS) {
       const match = line.match(pattern);
       if (match) {
         const [, dateStr, description, amountStr] = match;
@@ -234,17 +245,9 @@ function parseBankStatement(text: string, metadata: any): ParsedTransaction[] {
     }
   }
 
-  // If no transactions found with patterns, create a summary transaction
+  // Nothing matched; return no rows instead of a placeholder so the app shows its empty state
   if (transactions.length === 0) {
-    console.log('No transactions found with any method, creating summary');
-    transactions.push({
-      bankName: metadata.bankName,
-      clientName: metadata.clientName,
-      transactionDate: new Date().toISOString().split('T')[0],
-      description: `OCR Text Summary (${text.length} characters)`,
-      referenceNumber: 'OCR-SUMMARY',
-      amount: 0
-    });
+    console.log('No transactions found with any method');
   }
 
   return transactions;
@@ -342,27 +345,18 @@ export function parseTransactionDate(dateStr: string): string {
 /**
  * Parse grid-based transaction data
  */
-function parseGridBased(text: string, metadata: any): ParsedTransaction[] {
+function parseGridBased(lines: string[], metadata: any): ParsedTransaction[] {
   console.log('=== GRID-BASED PARSING ===');
 
   const transactions: ParsedTransaction[] = [];
-  const lines = text.split('\n').map(line => line.trim()).filter(line => line.length > 0);
 
   // Look for table headers to identify column positions
-  const headerPatterns = [
-    /date\s+description\s+amount/i,
-    /date\s+transaction\s+amount/i,
-    /date\s+memo\s+amount/i,
-    /posted\s+description\s+amount/i,
-    /trans\s+date\s+description\s+amount/i
-  ];
-
   let headerLineIndex = -1;
   let columnPositions: { date: number; description: number; amount: number } | null = null;
 
   // Find header line
   for (let i = 0; i < Math.min(lines.length, 20); i++) {
-    for (const pattern of headerPatterns) {
+    for (const pattern of GRID_HEADER_PATTERNS) {
       if (pattern.test(lines[i])) {
         headerLineIndex = i;
         console.log(`Found header at line ${i}: "${lines[i]}"`);
@@ -401,7 +395,9 @@ function parseGridBased(text: string, metadata: any): ParsedTransaction[] {
     const transaction = parseTransactionLine(line, columnPositions, metadata);
     if (transaction) {
       transactions.push(transaction);
-      console.log(`Parsed transaction: ${transaction.transactionDate} - ${transaction.description} - ${transaction.amount}`);
+      if (isDevelopment) {
+        console.log('Parsed transaction: %s - %s - %s', transaction.transactionDate, transaction.description, transaction.amount);
+      }
     }
   }
 
@@ -417,19 +413,16 @@ function detectColumnsBySpacing(lines: string[]): { date: number; description: n
   const sampleLines = lines.slice(0, Math.min(lines.length, 50));
 
   // Find lines with dates
-  const datePattern = /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/;
-  const amountPattern = /[\$]?\d+\.\d{2}\b/;
-
   let datePositions: number[] = [];
   let amountPositions: number[] = [];
 
   for (const line of sampleLines) {
-    const dateMatch = line.match(datePattern);
+    const dateMatch = line.match(SPACING_DATE_PATTERN);
     if (dateMatch) {
       datePositions.push(dateMatch.index!);
     }
 
-    const amountMatches = [...line.matchAll(amountPattern)];
+    const amountMatches = [...line.matchAll(SPACING_AMOUNT_PATTERN)];
     if (amountMatches.length > 0) {
       amountPositions.push(amountMatches[amountMatches.length - 1].index!);
     }
@@ -461,8 +454,8 @@ function parseHeaderColumns(headerLine: string): { date: number; description: nu
 
   // Find positions of key column headers
   const datePos = lowerHeader.indexOf('date');
-  const descriptionPos = lowerHeader.search(/\b(description|memo|transaction|details)\b/);
-  const amountPos = lowerHeader.search(/\b(amount|debit|credit|balance)\b/);
+  const descriptionPos = lowerHeader.search(HEADER_DESCRIPTION_COLUMN_PATTERN);
+  const amountPos = lowerHeader.search(HEADER_AMOUNT_COLUMN_PATTERN);
 
   if (datePos === -1 || descriptionPos === -1 || amountPos === -1) {
     return null;
@@ -479,19 +472,8 @@ function parseHeaderColumns(headerLine: string): { date: number; description: nu
  * Find where transaction data ends (before totals/summaries)
  */
 function findTransactionEnd(lines: string[], startIndex: number): number {
-  const summaryPatterns = [
-    /total/i,
-    /balance/i,
-    /summary/i,
-    /ending balance/i,
-    /beginning balance/i,
-    /deposits/i,
-    /withdrawals/i
-  ];
-
   for (let i = startIndex; i < lines.length; i++) {
-    const line = lines[i].toLowerCase();
-    if (summaryPatterns.some(pattern => pattern.test(line))) {
+    if (SUMMARY_LINE_PATTERN.test(lines[i])) {
       return i;
     }
   }
@@ -510,7 +492,7 @@ function parseTransactionLine(
   try {
     // Extract date (first column)
     const dateText = extractColumnText(line, columns.date, columns.description - columns.date);
-    const dateMatch = dateText.match(/\b(\d{1,2}\/\d{1,2}\/\d{2,4})\b/);
+    const dateMatch = dateText.match(COLUMN_DATE_PATTERN);
     if (!dateMatch) return null;
 
     let transactionDate = '';
@@ -534,7 +516,7 @@ function parseTransactionLine(
 
     // Extract amount (last column)
     const amountText = extractColumnText(line, columns.amount, line.length - columns.amount);
-    const amountMatch = amountText.match(/[\$]?([+-]?\d{1,3}(?:,\d{3})*\.\d{2}|\d+\.\d{2})/);
+    const amountMatch = amountText.match(COLUMN_AMOUNT_PATTERN);
     if (!amountMatch) return null;
 
     let amount = 0;
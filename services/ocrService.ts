@@ -1,6 +1,9 @@
-import { createWorker } from 'tesseract.js';
+import { createScheduler, createWorker, OEM } from 'tesseract.js';
+import type { Worker as TesseractWorker } from 'tesseract.js';
 import * as pdfjsLib from 'pdfjs-dist';
+import type { PDFDocumentProxy, PDFPageProxy } from 'pdfjs-dist';
 import logger from './logger';
+import { cacheResult, getCachedResult, getOCRCacheKey } from './ocrCache';
 
 // Configure PDF.js worker to use local file with fallback
 try {
@@ -19,11 +22,61 @@ export interface OCRProgressCallback {
   (progress: { status: string; progress: number }): void;
 }
 
+export interface OCROptions {
+  // Scale PDF pages are rendered at for the image fallback; lower is faster, higher helps small print
+  renderScale?: number;
+}
+
 export interface OCRResult {
   text: string;
   confidence: number;
 }
 
+// Tesseract workers each hold their own WASM instance and language data, so cap the pool
+const MAX_OCR_WORKERS = Math.max(1, Math.min(navigator.hardwareConcurrency || 2, 4));
+
+// Worker configuration shared by every pooled Tesseract worker
+const OCR_LANGUAGE = 'eng';
+const OCR_ENGINE_MODE = OEM.LSTM_ONLY;
+
+// Only plain text and confidence are consumed, so skip building blocks, hOCR and TSV output
+const OCR_OUTPUT_FORMATS = { text: true };
+
+// Higher scale for better OCR, capped so large-format pages are not rendered far beyond
+// what Tesseract needs (3508px is the long side of A4 at 300 DPI). OCR time grows with pixel
+// count, so callers may trade accuracy for speed within the allowed scale range.
+const PDF_RENDER_SCALE = 2.0;
+const PDF_MIN_RENDER_SCALE = 1.0;
+const PDF_MAX_RENDER_SCALE = 3.0;
+const PDF_MAX_RENDER_DIMENSION = 3508;
+
+// Any channel darker than this counts as ink when checking for blank pages
+const BLANK_PAGE_INK_LEVEL = 200;
+// Longest side of the downscaled copy read first when checking for blank pages
+const BLANK_PAGE_SAMPLE_DIMENSION = 256;
+
+// Release the pooled workers once OCR has been idle for this long
+const OCR_WORKER_IDLE_MS = 60 * 1000;
+
+// Workers are created on demand and reused across calls instead of being spun up per file.
+// A terminated scheduler keeps its dead workers registered, so idle shutdown replaces it.
+let ocrScheduler = createScheduler();
+let ocrWorkers: Promise<TesseractWorker>[] = [];
+let activeOCRJobs = 0;
+let idleShutdownTimer: ReturnType<typeof setTimeout> | null = null;
+
+// Fine-grained worker progress is only meaningful while a single image is being recognised
+let imageProgressListener: OCRProgressCallback | null = null;
+
+const OCR_SUPPORTED_TYPES = new Set([
+  'application/pdf',
+  'image/jpeg',
+  'image/png',
+  'image/webp',
+  'image/tiff',
+  'image/bmp'
+]);
+
 /**
  * Check if PDF.js worker is properly configured
  */
@@ -37,17 +90,21 @@ function isPDFWorkerAvailable(): boolean {
 }
 
 /**
- * Extract text from PDF files using PDF.js
+ * Load a PDF document once so text extraction and the image fallback share it
  */
-async function extractTextFromPDF(file: File, onProgress?: OCRProgressCallback): Promise<string> {
+async function loadPDFDocument(data: ArrayBuffer): Promise<PDFDocumentProxy> {
   if (!isPDFWorkerAvailable()) {
     throw new Error('PDF.js worker is not properly configured. Please refresh the page and try again.');
   }
 
-  try {
-    const arrayBuffer = await file.arrayBuffer();
-    const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
+  return pdfjsLib.getDocument({ data }).promise;
+}
 
+/**
+ * Extract text from PDF files using PDF.js
+ */
+async function extractTextFromPDF(pdf: PDFDocumentProxy, onProgress?: OCRProgressCallback): Promise<string> {
+  try {
     let fullText = '';
     const totalPages = pdf.numPages;
 
@@ -84,52 +141,161 @@ async function extractTextFromPDF(file: File, onProgress?: OCRProgressCallback):
   }
 }
 
+/**
+ * Compute a SHA-256 content digest used to key the OCR result cache
+ */
+async function computeFileDigest(data: ArrayBuffer, fileType: string): Promise<string | null> {
+  if (!globalThis.crypto?.subtle) {
+    // SubtleCrypto is only exposed in secure contexts; skip caching elsewhere
+    return null;
+  }
+
+  const digest = await crypto.subtle.digest('SHA-256', data);
+  const hex = Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('');
+  return `${fileType}:${hex}`;
+}
+
+/**
+ * Grow the shared worker pool to the requested size and mark an OCR job as active.
+ * Callers must pair every call with releaseOCRWorkers(), even when this throws.
+ */
+async function acquireOCRWorkers(count: number): Promise<void> {
+  activeOCRJobs++;
+  if (idleShutdownTimer) {
+    clearTimeout(idleShutdownTimer);
+    idleShutdownTimer = null;
+  }
+
+  const scheduler = ocrScheduler;
+  const target = Math.min(Math.max(count, 1), MAX_OCR_WORKERS);
+  while (ocrWorkers.length < target) {
+    const pending: Promise<TesseractWorker> = createWorker(OCR_LANGUAGE, OCR_ENGINE_MODE, {
+      logger: m => {
+        // Worker messages carry no caller identity, so forward them only while a single job is running
+        if (imageProgressListener && activeOCRJobs === 1 && m.status) {
+          imageProgressListener({
+            status: m.status,
+            progress: m.progress || 0
+          });
+        }
+      }
+    }).then(worker => {
+      scheduler.addWorker(worker);
+      return worker;
+    }).catch(error => {
+      ocrWorkers = ocrWorkers.filter(entry => entry !== pending);
+      throw error;
+    });
+    ocrWorkers.push(pending);
+  }
+
+  await Promise.all(ocrWorkers.slice(0, target));
+}
+
+/**
+ * Mark an OCR job as finished and schedule pool shutdown once nothing is running
+ */
+function releaseOCRWorkers(): void {
+  activeOCRJobs--;
+  if (activeOCRJobs > 0) {
+    return;
+  }
+
+  idleShutdownTimer = setTimeout(() => {
+    idleShutdownTimer = null;
+    const idleScheduler = ocrScheduler;
+    ocrScheduler = createScheduler();
+    ocrWorkers = [];
+    void idleScheduler.terminate();
+  }, OCR_WORKER_IDLE_MS);
+}
+
 /**
  * Perform OCR on image files using Tesseract.js
  */
 async function performOCR(file: File, onProgress?: OCRProgressCallback): Promise<OCRResult> {
-  const worker = await createWorker('eng', 1, {
-    logger: m => {
-      if (onProgress && m.status) {
-        onProgress({
-          status: m.status,
-          progress: m.progress || 0
-        });
-      }
-    }
-  });
+  if (onProgress) {
+    imageProgressListener = onProgress;
+  }
 
   try {
-    const { data: { text, confidence } } = await worker.recognize(file);
+    await acquireOCRWorkers(1);
+    const { data: { text, confidence } } = await ocrScheduler.addJob('recognize', file, {}, OCR_OUTPUT_FORMATS);
     return { text, confidence };
   } finally {
-    await worker.terminate();
+    // Leave a listener installed by a later call in place
+    if (imageProgressListener === onProgress) {
+      imageProgressListener = null;
+    }
+    releaseOCRWorkers();
   }
 }
 
 /**
- * Convert PDF pages to images for OCR processing
+ * Check whether any pixel in the given region of a context is dark enough to count as ink
  */
-async function convertPDFToImages(file: File, onProgress?: OCRProgressCallback): Promise<File[]> {
-  const arrayBuffer = await file.arrayBuffer();
-  const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
+function hasInk(context: CanvasRenderingContext2D, width: number, height: number): boolean {
+  const { data } = context.getImageData(0, 0, width, height);
+  for (let i = 0; i < data.length; i += 4) {
+    if (data[i] < BLANK_PAGE_INK_LEVEL || data[i + 1] < BLANK_PAGE_INK_LEVEL || data[i + 2] < BLANK_PAGE_INK_LEVEL) {
+      return true;
+    }
+  }
+  return false;
+}
 
-  const images: File[] = [];
-  const totalPages = pdf.numPages;
+/**
+ * Detect rendered pages with no ink at all so Tesseract is not run on them
+ */
+export function isBlankPage(canvas: HTMLCanvasElement): boolean {
+  const context = canvas.getContext('2d');
+  if (!context) {
+    return false;
+  }
 
-  for (let pageNum = 1; pageNum <= totalPages; pageNum++) {
-    if (onProgress) {
-      onProgress({
-        status: `Converting page ${pageNum} to image`,
-        progress: (pageNum - 1) / totalPages
-      });
+  // Downscaling averages pixels, so a dark sample pixel always comes from real ink and most
+  // pages are settled here without reading back the full-resolution canvas
+  const sampleScale = BLANK_PAGE_SAMPLE_DIMENSION / Math.max(canvas.width, canvas.height);
+  if (sampleScale < 1) {
+    const sample = document.createElement('canvas');
+    sample.width = Math.max(1, Math.round(canvas.width * sampleScale));
+    sample.height = Math.max(1, Math.round(canvas.height * sampleScale));
+    const sampleContext = sample.getContext('2d', { willReadFrequently: true });
+    if (sampleContext) {
+      sampleContext.drawImage(canvas, 0, 0, sample.width, sample.height);
+      const sampleHasInk = hasInk(sampleContext, sample.width, sample.height);
+      sample.width = 0;
+      sample.height = 0;
+      if (sampleHasInk) {
+        return false;
+      }
     }
+  }
+
+  // Thin strokes can fade below the ink level when averaged away, so confirm at full resolution
+  return !hasInk(context, canvas.width, canvas.height);
+}
+
+/**
+ * Pick a render scale that upsamples for OCR without letting oversized pages exceed the cap
+ */
+function getRenderScale(page: PDFPageProxy, renderScale: number): number {
+  const { width, height } = page.getViewport({ scale: 1 });
+  const longestSide = Math.max(width, height);
+  return Math.min(renderScale, PDF_MAX_RENDER_DIMENSION / longestSide);
+}
 
+/**
+ * Render PDF pages to canvases one at a time, so pages can be queued for OCR as soon as they are ready
+ */
+async function* renderPDFPages(pdf: PDFDocumentProxy, renderScale: number): AsyncGenerator<HTMLCanvasElement> {
+  for (let pageNum = 1; pageNum <= pdf.numPages; pageNum++) {
     const page = await pdf.getPage(pageNum);
-    const viewport = page.getViewport({ scale: 2.0 }); // Higher scale for better OCR
+    const viewport = page.getViewport({ scale: getRenderScale(page, renderScale) });
 
     const canvas = document.createElement('canvas');
-    const context = canvas.getContext('2d')!;
+    // pdf.js paints an opaque white page background, so an alpha channel is never needed
+    const context = canvas.getContext('2d', { alpha: false })!;
     canvas.height = viewport.height;
     canvas.width = viewport.width;
 
@@ -138,144 +304,203 @@ async function convertPDFToImages(file: File, onProgress?: OCRProgressCallback):
       canvas: canvas,
       viewport: viewport
     }).promise;
+    // Drop the page's operator list and decoded resources now that its pixels are on the canvas
+    page.cleanup();
 
-    canvas.toBlob((blob) => {
-      if (blob) {
-        const imageFile = new File([blob], `page-${pageNum}.png`, { type: 'image/png' });
-        images.push(imageFile);
-      }
-    }, 'image/png');
+    // Hand the finished canvas over directly; tesseract.js encodes it itself once the job runs,
+    // and there is no fire-and-forget toBlob callback left to race the OCR loop
+    yield canvas;
   }
+}
 
-  if (onProgress) {
-    onProgress({ status: 'PDF conversion complete', progress: 1 });
+/**
+ * Render and OCR PDF pages as a pipeline across the shared Tesseract.js worker pool
+ */
+async function performOCROnPDF(
+  pdf: PDFDocumentProxy,
+  renderScale: number,
+  onProgress: OCRProgressCallback | undefined,
+  baseProgress: number,
+  progressSpan: number
+): Promise<OCRResult> {
+  const totalPages = pdf.numPages;
+  if (totalPages === 0) {
+    return { text: '', confidence: 0 };
   }
 
-  return images;
+  try {
+    await acquireOCRWorkers(totalPages);
+
+    // Rendering stays a couple of pages ahead of the workers instead of holding every page at once
+    const maxQueuedPages = ocrWorkers.length * 2;
+    const queued = new Set<Promise<void>>();
+    const pages: Promise<{ text: string; confidence: number } | null>[] = [];
+    let completed = 0;
+
+    for await (const canvas of renderPDFPages(pdf, renderScale)) {
+      if (onProgress) {
+        onProgress({
+          status: `Converted page ${pages.length + 1} of ${totalPages} to image`,
+          progress: baseProgress + (completed / totalPages) * progressSpan
+        });
+      }
+
+      const page = (async () => {
+        const data = isBlankPage(canvas)
+          ? null
+          : (await ocrScheduler.addJob('recognize', canvas, {}, OCR_OUTPUT_FORMATS)).data;
+        // Shrinking the canvas frees its backing store now rather than whenever it is collected
+        canvas.width = 0;
+        canvas.height = 0;
+        completed++;
+        if (onProgress) {
+          onProgress({
+            status: `OCR processed page ${completed} of ${totalPages}`,
+            progress: baseProgress + (completed / totalPages) * progressSpan
+          });
+        }
+        return data;
+      })();
+      pages.push(page);
+
+      const settled: Promise<void> = page.then(() => { queued.delete(settled); }, () => { queued.delete(settled); });
+      queued.add(settled);
+      if (queued.size >= maxQueuedPages) {
+        await Promise.race(queued);
+      }
+    }
+
+    // Promise.all keeps page order regardless of which worker finished first
+    const results = await Promise.all(pages);
+    const recognised = results.filter(page => page !== null);
+    return {
+      text: results.map(page => (page ? page.text : '') + '\n').join(''),
+      confidence: recognised.length > 0
+        ? recognised.reduce((sum, page) => sum + page.confidence, 0) / recognised.length
+        : 0
+    };
+  } finally {
+    releaseOCRWorkers();
+  }
 }
 
 /**
- * Main OCR processing function that handles different file types
+ * Extract text from a file, routing PDFs, images and plain text to the right extractor
  */
-export async function processFileWithOCR(
+async function extractFileText(
   file: File,
+  data: ArrayBuffer,
+  renderScale: number,
   onProgress?: OCRProgressCallback
 ): Promise<{ text: string; confidence?: number }> {
   const fileType = file.type;
 
-  logger.info('Starting OCR processing for file:', file.name, 'Size:', file.size, 'bytes');
-
-  try {
-    if (onProgress) {
-      onProgress({ status: 'Starting OCR processing', progress: 0 });
-    }
-
-    let extractedText = '';
+  let extractedText = '';
 
-    // Handle PDF files
-    if (fileType === 'application/pdf') {
-      try {
+  // Handle PDF files
+  if (fileType === 'application/pdf') {
+    let pdf: PDFDocumentProxy | null = null;
+    try {
   logger.info('Processing PDF file...');
-        extractedText = await extractTextFromPDF(file, onProgress);
+      pdf = await loadPDFDocument(data);
+      extractedText = await extractTextFromPDF(pdf, onProgress);
   logger.info('PDF text extraction complete. Length:', extractedText.length);
   logger.info('First 1000 characters:', extractedText.substring(0, 1000));
 
-        // If PDF has little text content, fall back to OCR on images
-        if (extractedText.trim().length < 100) {
-          if (onProgress) {
-            onProgress({ status: 'PDF has limited text, converting to images for OCR', progress: 0.5 });
-          }
-
-          const imageFiles = await convertPDFToImages(file, onProgress);
-          let combinedText = '';
-          let totalConfidence = 0;
-
-          for (let i = 0; i < imageFiles.length; i++) {
-            const imageFile = imageFiles[i];
-            if (onProgress) {
-              onProgress({
-                status: `OCR processing page ${i + 1} of ${imageFiles.length}`,
-                progress: 0.5 + (i / imageFiles.length) * 0.5
-              });
-            }
-
-            const ocrResult = await performOCR(imageFile, (progress) => {
-              if (onProgress) {
-                const baseProgress = 0.5 + (i / imageFiles.length) * 0.5;
-                onProgress({
-                  status: progress.status,
-                  progress: baseProgress + (progress.progress * 0.5 / imageFiles.length)
-                });
-              }
-            });
-
-            combinedText += ocrResult.text + '\n';
-            totalConfidence += ocrResult.confidence;
-          }
-
-          return {
-            text: combinedText,
-            confidence: totalConfidence / imageFiles.length
-          };
-        } else {
-          return { text: extractedText };
-        }
-      } catch (pdfError) {
-        console.warn('PDF text extraction failed, falling back to OCR:', pdfError);
-
-        // Fallback: convert PDF to images and use OCR
+      // If PDF has little text content, fall back to OCR on images
+      if (extractedText.trim().length < 100) {
         if (onProgress) {
-          onProgress({ status: 'PDF processing failed, converting to images for OCR', progress: 0.3 });
+          onProgress({ status: 'PDF has limited text, converting to images for OCR', progress: 0.5 });
         }
 
-        const imageFiles = await convertPDFToImages(file, onProgress);
-        let combinedText = '';
-        let totalConfidence = 0;
-
-        for (let i = 0; i < imageFiles.length; i++) {
-          const imageFile = imageFiles[i];
-          if (onProgress) {
-            onProgress({
-              status: `OCR processing page ${i + 1} of ${imageFiles.length}`,
-              progress: 0.3 + (i / imageFiles.length) * 0.7
-            });
-          }
-
-          const ocrResult = await performOCR(imageFile);
-          combinedText += ocrResult.text + '\n';
-          totalConfidence += ocrResult.confidence;
-        }
+        return await performOCROnPDF(pdf, renderScale, onProgress, 0.5, 0.5);
+      } else {
+        return { text: extractedText };
+      }
+    } catch (pdfError) {
+      console.warn('PDF text extraction failed, falling back to OCR:', pdfError);
 
-        return {
-          text: combinedText,
-          confidence: totalConfidence / imageFiles.length
-        };
+      // Fallback: convert PDF to images and use OCR
+      if (onProgress) {
+        onProgress({ status: 'PDF processing failed, converting to images for OCR', progress: 0.3 });
+      }
+
+      // pdf.js may have taken ownership of the buffer during the failed load, so read it afresh
+      pdf = pdf ?? await loadPDFDocument(await file.arrayBuffer());
+      return await performOCROnPDF(pdf, renderScale, onProgress, 0.3, 0.7);
+    } finally {
+      // Release the worker-side document and its cached pages as soon as this file is done
+      if (pdf) {
+        void pdf.destroy();
       }
     }
+  }
 
-    // Handle image files
-    else if (fileType.startsWith('image/')) {
+  // Handle image files
+  else if (fileType.startsWith('image/')) {
   logger.info('Processing image file...');
-      const ocrResult = await performOCR(file, onProgress);
+    const ocrResult = await performOCR(file, onProgress);
   logger.info('Image OCR complete. Length:', ocrResult.text.length);
-      return ocrResult;
-    }
+    return ocrResult;
+  }
+
+  // Handle text-based files (DOCX, TXT)
+  else if (fileType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document') {
+    // For DOCX, we rely on the existing mammoth.js processing in the main app
+    throw new Error('DOCX files should be processed by the main application logic');
+  }
+
+  else if (fileType === 'text/plain') {
+    // For TXT files, just read the text directly
+    const text = await file.text();
+    return { text };
+  }
+
+  else {
+    throw new Error(`Unsupported file type for OCR: ${fileType}`);
+  }
+}
 
-    // Handle text-based files (DOCX, TXT)
-    else if (fileType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document') {
-      // For DOCX, we rely on the existing mammoth.js processing in the main app
-      throw new Error('DOCX files should be processed by the main application logic');
+/**
+ * Main OCR processing function that handles different file types
+ */
+export async function processFileWithOCR(
+  file: File,
+  onProgress?: OCRProgressCallback,
+  options: OCROptions = {}
+): Promise<{ text: string; confidence?: number }> {
+  logger.info('Starting OCR processing for file:', file.name, 'Size:', file.size, 'bytes');
+
+  try {
+    if (onProgress) {
+      onProgress({ status: 'Starting OCR processing', progress: 0 });
     }
 
-    else if (fileType === 'text/plain') {
-      // For TXT files, just read the text directly
-      const text = await file.text();
-      return { text };
+    const renderScale = Math.min(
+      Math.max(options.renderScale ?? PDF_RENDER_SCALE, PDF_MIN_RENDER_SCALE),
+      PDF_MAX_RENDER_SCALE
+    );
+
+    // Read the upload once: the digest finishes before pdf.js is handed the same buffer
+    const data = await file.arrayBuffer();
+
+    // Extracted text is cached by content digest, so re-processing the same upload skips OCR
+    const digest = await computeFileDigest(data, file.type);
+    const cacheKey = digest ? getOCRCacheKey(digest, renderScale) : null;
+    const cached = cacheKey ? getCachedResult(cacheKey) : undefined;
+    if (cached) {
+      logger.info('OCR cache hit for file:', file.name);
+      if (onProgress) {
+        onProgress({ status: 'Loaded previously extracted text', progress: 1 });
+      }
+      return cached;
     }
 
-    else {
-      throw new Error(`Unsupported file type for OCR: ${fileType}`);
+    const result = await extractFileText(file, data, renderScale, onProgress);
+    if (cacheKey && result.text.trim().length > 0) {
+      cacheResult(cacheKey, result);
     }
+    return result;
 
   } catch (error) {
     console.error('OCR processing error:', error);
@@ -301,16 +526,18 @@ export async function processFileWithOCR(
   }
 }
 
+/**
+ * Start loading a Tesseract worker and its language data ahead of the first OCR job
+ */
+export function warmUpOCR(): void {
+  acquireOCRWorkers(1)
+    .catch(error => logger.warn('OCR warm-up failed:', error))
+    .finally(releaseOCRWorkers);
+}
+
 /**
  * Check if OCR is supported for a given file type
  */
 export function isOCRSupported(fileType: string): boolean {
-  return [
-    'application/pdf',
-    'image/jpeg',
-    'image/png',
-    'image/webp',
-    'image/tiff',
-    'image/bmp'
-  ].includes(fileType);
+  return OCR_SUPPORTED_TYPES.has(fileType);
 }
\ No newline at end of file
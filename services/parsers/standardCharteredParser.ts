@@ -23,6 +23,8 @@ const PAGE_FOOTER_PATTERN = /^page\s+\d+\s+of\s+/i;
 const TEXTUAL_DATE_PATTERN = /^(\d{1,2})\s+([A-Za-z]{3})\s+(\d{2,4})/;
 const HYBRID_TEXTUAL_DATE_PATTERN = /^(\d{1,2})[-\s]?([A-Za-z]{3})[-\s]?(\d{2,4})/;
 const NUMERIC_DATE_PATTERN = /^(\d{1,2})[\/-](\d{1,2})[\/-](\d{2,4})/;
+const LEADING_DIGIT_PATTERN = /^\d/;
+const LIST_MARKER_PREFIX_PATTERN = /^(?:\*|\d+|[ivxlcdm]+|\([^)]+\))[\.)-]?\s+/i;
 const NON_TRANSACTION_HINTS = /(statement\s+date|account\s+statement|page\s+\d|branch\s+address|account\s+type|account\s+no|nominee|ifsc|micr|currency\s*:|smart\s+banking\s+savings)/i;
 
 const MONTH_MAP: Record<string, string> = {
@@ -371,10 +373,16 @@ interface AmountToken {
 }
 
 function matchLeadingDate(text: string): LeadingDateMatch | null {
-  const prefixMatch = text.match(/^(?:\*|\d+|[ivxlcdm]+|\([^)]+\))[\.)-]?\s+/i);
+  const prefixMatch = text.match(LIST_MARKER_PREFIX_PATTERN);
   const prefix = prefixMatch ? prefixMatch[0] : '';
   const candidate = prefix ? text.slice(prefix.length) : text;
 
+  // Every supported date layout opens with the day number, so lines that do not start with a
+  // digit can skip the pattern cascade entirely
+  if (!LEADING_DIGIT_PATTERN.test(candidate)) {
+    return null;
+  }
+
   const textual = candidate.match(TEXTUAL_DATE_PATTERN);
   if (textual) {
     const iso = textualMatchToIso(textual);
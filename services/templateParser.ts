@@ -5,6 +5,43 @@ import {
   parseStandardCharteredStatement
 } from './parsers/standardCharteredParser';
 
+// Per-row debug output is only worth producing while developing
+const isDevelopment = import.meta.env.DEV;
+
+const TRANSACTION_HEADER_PATTERNS = [
+  /date|transaction|amount/i,
+  /posted|description|debit|credit/i,
+  /^\s*(\d{1,2}\/\d{1,2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)/i
+];
+const FIRST_DATE_LINE_PATTERN = /\d{1,2}\/\d{1,2}\/\d{2,4}|^\d{1,2}\s+[A-Z][a-z]{2}/;
+const SECTION_END_PATTERNS = [
+  /^total|^balance|^summary|^ending|^fees|^interest|^average|^thank you/i,
+  /^[A-Z][A-Za-z]+\s+[A-Z]/  // Likely a new section header
+];
+const SHORT_DATE_PATTERN = /\d{1,2}\/\d{1,2}/;
+const LINE_DATE_PATTERN = /\b\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}\b|\b\d{1,2}\s+[A-Z][a-z]{2}\b/;
+const LINE_AMOUNT_PATTERN = /\d+\.\d{2}|\$\d+/;
+const LINE_DESCRIPTION_PATTERN = /[A-Z]{2,}/;
+const TRANSACTION_DATE_PATTERN = /\b(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})\b|\b(\d{1,2})\s+([A-Z][a-z]{2})\s+(\d{4})\b/;
+const TRANSACTION_AMOUNT_PATTERN = /([+-]?\$?)(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/g;
+const DEBIT_INDICATOR_PATTERN = /debit|withdrawal|charge|payment out/i;
+const DIRECT_LINE_PATTERN = /^(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})\s+(.+?)\s+([\-\$]?\d{1,3}(?:,\d{3})*\.\d{2})$/;
+const DIRECT_DATE_PATTERN = /(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})/;
+const DIRECT_AMOUNT_PATTERN = /([\-\$]?\d{1,3}(?:,\d{3})*\.\d{2})/;
+const ACCOUNT_HOLDER_PATTERNS = [
+  /(?:Account.*?Holder|Customer Name|Name)[\s:]*([A-Z][A-Za-z\s]+)(?=\n|Account|$)/i,
+  /^([A-Z][A-Za-z\s]{5,40})\n/m
+];
+const ACCOUNT_NUMBER_PATTERNS = [
+  /Account Number[:\s]+([0-9\-]+)/i,
+  /Account\s*#?\s*([0-9\-]{10,})/i,
+  /[Xx]{6,}([0-9]{4})/
+];
+const STATEMENT_PERIOD_PATTERNS = [
+  /(?:Statement Period|Period|For the period|Statement Date)[\s:]*([A-Za-z]+ \d{1,2}, \d{4})\s*-\s*([A-Za-z]+ \d{1,2}, \d{4})/i,
+  /([A-Za-z]+\s+\d{1,2})\s*(?:to|-)\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})/i
+];
+
 /**
  * Parse OCR text with template detection and smart extraction
  */
@@ -87,13 +124,8 @@ function extractMetadata(text: string): {
   }
 
   // Extract account holder - look for common patterns
-  const holderPatterns = [
-    /(?:Account.*?Holder|Customer Name|Name)[\s:]*([A-Z][A-Za-z\s]+)(?=\n|Account|$)/i,
-    /^([A-Z][A-Za-z\s]{5,40})\n/m
-  ];
-
   if (metadata.accountHolder === 'Customer') {
-    for (const pattern of holderPatterns) {
+    for (const pattern of ACCOUNT_HOLDER_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         metadata.accountHolder = tidyName(fixOcrName(match[1]));
@@ -103,14 +135,8 @@ function extractMetadata(text: string): {
   }
 
   // Extract account number
-  const accountPatterns = [
-    /Account Number[:\s]+([0-9\-]+)/i,
-    /Account\s*#?\s*([0-9\-]{10,})/i,
-    /[Xx]{6,}([0-9]{4})/
-  ];
-
   if (!metadata.accountNumber) {
-    for (const pattern of accountPatterns) {
+    for (const pattern of ACCOUNT_NUMBER_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         metadata.accountNumber = match[1].trim();
@@ -120,13 +146,8 @@ function extractMetadata(text: string): {
   }
 
   // Extract statement period
-  const periodPatterns = [
-    /(?:Statement Period|Period|For the period|Statement Date)[\s:]*([A-Za-z]+ \d{1,2}, \d{4})\s*-\s*([A-Za-z]+ \d{1,2}, \d{4})/i,
-    /([A-Za-z]+\s+\d{1,2})\s*(?:to|-)\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})/i
-  ];
-
   if (!metadata.statementPeriod) {
-    for (const pattern of periodPatterns) {
+    for (const pattern of STATEMENT_PERIOD_PATTERNS) {
       const match = text.match(pattern);
       if (match) {
         metadata.statementPeriod = `${match[1]} - ${match[2]}`;
@@ -182,16 +203,18 @@ function detectAndExtractTransactions(
 ): ParsedTransaction[] {
   const transactions: ParsedTransaction[] = [];
 
-  // Split text into lines for analysis
-  const lines = text.split('\n').filter(line => line.trim().length > 0);
+  // Split text into lines for analysis, trimming once here so no strategy has to repeat it
+  const lines = text.split('\n').map(line => line.trim()).filter(line => line.length > 0);
 
   console.log(`Processing ${lines.length} lines`);
   
   // Debug: Show first 30 lines
-  console.log('First 30 lines of text:');
-  lines.slice(0, 30).forEach((line, i) => {
-    console.log(`${i}: "${line.substring(0, 100)}"`);
-  });
+  if (isDevelopment) {
+    console.log('First 30 lines of text:');
+    lines.slice(0, 30).forEach((line, i) => {
+      console.log('%d: "%s"', i, line.substring(0, 100));
+    });
+  }
 
   // Try direct date + amount pattern matching first (aggressive approach)
   const directTransactions = extractDirectTransactions(lines, metadata);
@@ -218,16 +241,16 @@ function detectAndExtractTransactions(
   console.log(`Extracting transactions from line ${startIndex} to ${endIndex}`);
 
   for (let i = startIndex; i < endIndex; i++) {
-    const line = lines[i].trim();
-
-    if (line.length === 0) continue;
+    const line = lines[i];
 
     // Check if line looks like a transaction
     if (looksLikeTransaction(line)) {
       const transaction = parseTransactionLine(line, metadata);
       if (transaction) {
         transactions.push(transaction);
-        console.log(`✓ Parsed: ${transaction.transactionDate} | ${transaction.description} | ${transaction.amount}`);
+        if (isDevelopment) {
+          console.log('✓ Parsed: %s | %s | %s', transaction.transactionDate, transaction.description, transaction.amount);
+        }
       }
     }
   }
@@ -247,15 +270,15 @@ function extractDirectTransactions(
   
   // Strategy 1: Look for date at start, amount at end (most precise)
   console.log('Strategy 1: Date at start, amount at end...');
-  const s1Pattern = /^(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})\s+(.+?)\s+([\-\$]?\d{1,3}(?:,\d{3})*\.\d{2})$/;
   for (const line of lines) {
-    const trimmed = line.trim();
-    const match = s1Pattern.exec(trimmed);
+    const match = DIRECT_LINE_PATTERN.exec(line);
     if (match) {
       const txn = parseTransactionFromMatch(match, metadata, transactions.length);
       if (txn) {
         transactions.push(txn);
-        console.log(`✓ S1: ${txn.transactionDate} | ${txn.description} | ${txn.amount}`);
+        if (isDevelopment) {
+          console.log('✓ S1: %s | %s | %s', txn.transactionDate, txn.description, txn.amount);
+        }
       }
     }
   }
@@ -263,15 +286,11 @@ function extractDirectTransactions(
 
   // Strategy 2: Date + amount with flexible whitespace/separators
   console.log('Strategy 2: Date + amount with flexible patterns...');
-  const dateRegex = /(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})/;
-  const amountRegex = /([\-\$]?\d{1,3}(?:,\d{3})*\.\d{2})/;
-  
-  for (const line of lines) {
-    const trimmed = line.trim();
+  for (const trimmed of lines) {
     if (trimmed.length < 10) continue;
     
-    const dateMatch = dateRegex.exec(trimmed);
-    const amountMatch = amountRegex.exec(trimmed);
+    const dateMatch = DIRECT_DATE_PATTERN.exec(trimmed);
+    const amountMatch = DIRECT_AMOUNT_PATTERN.exec(trimmed);
     
     if (dateMatch && amountMatch) {
       try {
@@ -286,19 +305,19 @@ function extractDirectTransactions(
         let amount = parseFloat(amountStr);
         
         // Check if it should be negative (various indicators)
-        const lowerLine = trimmed.toLowerCase();
-        if (amountMatch[1].startsWith('-') || 
-            lowerLine.includes('debit') || 
-            lowerLine.includes('withdrawal') ||
-            lowerLine.includes('charge') ||
-            lowerLine.includes('payment out')) {
+        if (amountMatch[1].startsWith('-') || DEBIT_INDICATOR_PATTERN.test(trimmed)) {
           amount = -amount;
         }
         
-        // Extract description: remove date and amount
-        let description = trimmed
-          .replace(dateRegex, '')
-          .replace(amountRegex, '')
+        // Extract description: remove date and amount by their match offsets, falling back
+        // to re-searching only when the amount precedes or overlaps the date
+        const dateEnd = dateMatch.index + dateMatch[0].length;
+        const withoutMatches = dateEnd <= amountMatch.index
+          ? trimmed.slice(0, dateMatch.index) +
+            trimmed.slice(dateEnd, amountMatch.index) +
+            trimmed.slice(amountMatch.index + amountMatch[0].length)
+          : trimmed.replace(DIRECT_DATE_PATTERN, '').replace(DIRECT_AMOUNT_PATTERN, '');
+        let description = withoutMatches
           .trim()
           .replace(/[\-–—]/g, '') // Remove various dash types
           .replace(/\s+/g, ' ')
@@ -315,7 +334,9 @@ function extractDirectTransactions(
           amount
         });
         
-        console.log(`✓ S2: ${transactionDate} | ${description} | ${amount}`);
+        if (isDevelopment) {
+          console.log('✓ S2: %s | %s | %s', transactionDate, description, amount);
+        }
       } catch (error) {
         console.warn('S2 parse error:', error);
       }
@@ -326,11 +347,11 @@ function extractDirectTransactions(
   // Strategy 3: Multi-line transactions
   console.log('Strategy 3: Multi-line transactions...');
   for (let i = 0; i < lines.length - 1; i++) {
-    const current = lines[i].trim();
-    const next = lines[i + 1].trim();
+    const current = lines[i];
+    const next = lines[i + 1];
     
-    const dateMatch = dateRegex.exec(current);
-    const amountMatch = amountRegex.exec(next);
+    const dateMatch = DIRECT_DATE_PATTERN.exec(current);
+    const amountMatch = DIRECT_AMOUNT_PATTERN.exec(next);
     
     if (dateMatch && amountMatch && current.length > 5 && next.length > 5) {
       try {
@@ -340,7 +361,7 @@ function extractDirectTransactions(
         const transactionDate = `${year}-${month}-${day}`;
         
         const amountStr = next
-          .replace(amountRegex, '$1')
+          .replace(DIRECT_AMOUNT_PATTERN, '$1')
           .replace(/[\$\-]/g, '')
           .replace(/,/g, '');
         let amount = parseFloat(amountStr);
@@ -350,7 +371,7 @@ function extractDirectTransactions(
         }
         
         const description = current
-          .replace(dateRegex, '')
+          .replace(DIRECT_DATE_PATTERN, '')
           .trim()
           .substring(0, 100);
         
@@ -365,7 +386,9 @@ function extractDirectTransactions(
           amount
         });
         
-        console.log(`✓ S3: ${transactionDate} | ${description} | ${amount}`);
+        if (isDevelopment) {
+          console.log('✓ S3: %s | %s | %s', transactionDate, description, amount);
+        }
         i++; // Skip next line as we used it
       } catch (error) {
         console.warn('S3 parse error:', error);
@@ -379,8 +402,8 @@ function extractDirectTransactions(
   const amountMatches: Array<{line: number; match: RegExpExecArray}> = [];
   
   lines.forEach((line, idx) => {
-    const dm = dateRegex.exec(line);
-    const am = amountRegex.exec(line);
+    const dm = DIRECT_DATE_PATTERN.exec(line);
+    const am = DIRECT_AMOUNT_PATTERN.exec(line);
     if (dm) dateMatches.push({ line: idx, match: dm });
     if (am) amountMatches.push({ line: idx, match: am });
   });
@@ -426,7 +449,9 @@ function extractDirectTransactions(
           amount
         });
         
-        console.log(`✓ S4: ${transactionDate} | ${description} | ${amount}`);
+        if (isDevelopment) {
+          console.log('✓ S4: %s | %s | %s', transactionDate, description, amount);
+        }
       } catch (error) {
         console.warn('S4 parse error:', error);
       }
@@ -481,15 +506,9 @@ function parseTransactionFromMatch(
  * Find where the transaction table begins
  */
 function findTransactionHeader(lines: string[]): number {
-  const headerPatterns = [
-    /date|transaction|amount/i,
-    /posted|description|debit|credit/i,
-    /^\s*(\d{1,2}\/\d{1,2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)/i
-  ];
-
   // Look in first 20 lines for header
   for (let i = 0; i < Math.min(lines.length, 20); i++) {
-    const matchCount = headerPatterns.filter(p => p.test(lines[i])).length;
+    const matchCount = TRANSACTION_HEADER_PATTERNS.filter(p => p.test(lines[i])).length;
 
     if (matchCount >= 2) {
       return i;
@@ -498,7 +517,7 @@ function findTransactionHeader(lines: string[]): number {
 
   // Fallback: look for first date pattern
   for (let i = 0; i < Math.min(lines.length, 50); i++) {
-    if (/\d{1,2}\/\d{1,2}\/\d{2,4}|^\d{1,2}\s+[A-Z][a-z]{2}/.test(lines[i])) {
+    if (FIRST_DATE_LINE_PATTERN.test(lines[i])) {
       return i - 1;
     }
   }
@@ -510,20 +529,15 @@ function findTransactionHeader(lines: string[]): number {
  * Find where transaction section ends
  */
 function findSectionEnd(lines: string[], startIndex: number): number {
-  const endPatterns = [
-    /^total|^balance|^summary|^ending|^fees|^interest|^average|^thank you/i,
-    /^[A-Z][A-Za-z]+\s+[A-Z]/  // Likely a new section header
-  ];
-
   for (let i = startIndex; i < lines.length; i++) {
-    const line = lines[i].trim();
+    const line = lines[i];
 
-    if (endPatterns.some(pattern => pattern.test(line))) {
+    if (SECTION_END_PATTERNS.some(pattern => pattern.test(line))) {
       return i;
     }
 
     // If we've gone 100 lines without dates, probably past transactions
-    if (i - startIndex > 100 && !/\d{1,2}\/\d{1,2}/.test(line)) {
+    if (i - startIndex > 100 && !SHORT_DATE_PATTERN.test(line)) {
       return i;
     }
   }
@@ -536,13 +550,13 @@ function findSectionEnd(lines: string[], startIndex: number): number {
  */
 function looksLikeTransaction(line: string): boolean {
   // Must have a date
-  const hasDate = /\b\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}\b|\b\d{1,2}\s+[A-Z][a-z]{2}\b/.test(line);
+  const hasDate = LINE_DATE_PATTERN.test(line);
 
   // Must have an amount (number with 2 decimal places)
-  const hasAmount = /\d+\.\d{2}|\$\d+/.test(line);
+  const hasAmount = LINE_AMOUNT_PATTERN.test(line);
 
   // Should have some description text
-  const hasDescription = /[A-Z]{2,}/.test(line);
+  const hasDescription = LINE_DESCRIPTION_PATTERN.test(line);
 
   return hasDate && hasAmount && hasDescription;
 }
@@ -553,9 +567,7 @@ function looksLikeTransaction(line: string): boolean {
 function parseTransactionLine(line: string, metadata: any): ParsedTransaction | null {
   try {
     // Extract date
-    const dateMatch = line.match(
-      /\b(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2,4})\b|\b(\d{1,2})\s+([A-Z][a-z]{2})\s+(\d{4})\b/
-    );
+    const dateMatch = line.match(TRANSACTION_DATE_PATTERN);
 
     if (!dateMatch) return null;
 
@@ -575,7 +587,7 @@ function parseTransactionLine(line: string, metadata: any): ParsedTransaction |
     }
 
     // Extract amount (last number with decimals)
-    const amountMatches = [...line.matchAll(/([+-]?\$?)(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)/g)];
+    const amountMatches = [...line.matchAll(TRANSACTION_AMOUNT_PATTERN)];
     if (amountMatches.length === 0) return null;
 
     const lastAmount = amountMatches[amountMatches.length - 1];
@@ -588,8 +600,9 @@ function parseTransactionLine(line: string, metadata: any): ParsedTransaction |
     }
 
     // Extract description (text between date and amount)
-    const dateEndPos = line.indexOf(dateMatch[0]) + dateMatch[0].length;
-    const amountStartPos = line.lastIndexOf(lastAmount[0]);
+    // Reuse the match offsets instead of searching the line for the matched text again
+    const dateEndPos = dateMatch.index! + dateMatch[0].length;
+    const amountStartPos = lastAmount.index!;
     const description = line
       .substring(dateEndPos, amountStartPos)
       .trim()
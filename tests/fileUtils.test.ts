@@ -2,7 +2,7 @@
  * Unit Tests for File Utilities
  */
 
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect } from 'vitest';
 import {
   validateFileType,
   validateFileSize,
@@ -12,6 +12,7 @@ import {
   isImageFile,
   isPdfFile,
   isDocumentFile,
+  readFileAsDataURL,
 } from '../utils/fileUtils';
 import { MAX_FILE_SIZE } from '../config/app.config';
 
@@ -121,6 +122,13 @@ describe('fileUtils', () => {
     });
   });
 
+  describe('readFileAsDataURL', () => {
+    it('should return the base64 payload without the data URL prefix', async () => {
+      const file = new File(['hello'], 'test.txt', { type: 'text/plain' });
+      await expect(readFileAsDataURL(file)).resolves.toBe(btoa('hello'));
+    });
+  });
+
   describe('type checking functions', () => {
     it('isImageFile should detect image types', () => {
       expect(isImageFile('image/jpeg')).toBe(true);
@@ -0,0 +1,59 @@
+/**
+ * Unit Tests for the OCR Result Cache
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import {
+  OCR_CACHE_MAX_ENTRIES,
+  getOCRCacheKey,
+  getCachedResult,
+  cacheResult,
+  clearOCRCache,
+} from '../services/ocrCache';
+
+describe('ocrCache', () => {
+  beforeEach(() => {
+    clearOCRCache();
+  });
+
+  it('should return the stored result on a hit', () => {
+    const result = { text: 'statement text', confidence: 91 };
+    cacheResult('application/pdf:abc@2', result);
+
+    expect(getCachedResult('application/pdf:abc@2')).toEqual(result);
+    expect(getCachedResult('application/pdf:missing@2')).toBeUndefined();
+  });
+
+  it('should evict the least recently used entry once full', () => {
+    for (let i = 1; i <= OCR_CACHE_MAX_ENTRIES; i++) {
+      cacheResult(`key-${i}`, { text: `text ${i}` });
+    }
+
+    cacheResult(`key-${OCR_CACHE_MAX_ENTRIES + 1}`, { text: 'newest' });
+
+    expect(getCachedResult('key-1')).toBeUndefined();
+    expect(getCachedResult('key-2')).toEqual({ text: 'text 2' });
+    expect(getCachedResult(`key-${OCR_CACHE_MAX_ENTRIES + 1}`)).toEqual({ text: 'newest' });
+  });
+
+  it('should protect a recently read entry from eviction', () => {
+    for (let i = 1; i <= OCR_CACHE_MAX_ENTRIES; i++) {
+      cacheResult(`key-${i}`, { text: `text ${i}` });
+    }
+
+    getCachedResult('key-1');
+    cacheResult(`key-${OCR_CACHE_MAX_ENTRIES + 1}`, { text: 'newest' });
+
+    expect(getCachedResult('key-1')).toEqual({ text: 'text 1' });
+    expect(getCachedResult('key-2')).toBeUndefined();
+  });
+
+  it('should keep results rendered at different scales separate', () => {
+    const digest = 'application/pdf:abc';
+    cacheResult(getOCRCacheKey(digest, 2), { text: 'high resolution' });
+
+    expect(getOCRCacheKey(digest, 1)).not.toBe(getOCRCacheKey(digest, 2));
+    expect(getCachedResult(getOCRCacheKey(digest, 1))).toBeUndefined();
+    expect(getCachedResult(getOCRCacheKey(digest, 2))).toEqual({ text: 'high resolution' });
+  });
+});
@@ -0,0 +1,48 @@
+/**
+ * Unit Tests for the OCR text parser
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseOCRText } from '../services/ocrParser';
+
+describe('parseOCRText', () => {
+  it('should fall back to line patterns on a headerless bank statement', () => {
+    // Whole-number amounts slip past the template parser, so this reaches spacing-based column detection
+    const text = [
+      'Monthly Account Statement',
+      '01/05/2024 Rent payment 1200',
+      '01/12/2024 Salary deposit 3500',
+    ].join('\n');
+
+    const transactions = parseOCRText(text, 'bank');
+
+    expect(transactions).toHaveLength(2);
+    expect(transactions[0]).toMatchObject({
+      transactionDate: '2024-01-05',
+      description: 'Rent payment',
+      referenceNumber: 'OCR-1',
+      amount: 1200,
+    });
+    expect(transactions[1]).toMatchObject({
+      transactionDate: '2024-01-12',
+      description: 'Salary deposit',
+      referenceNumber: 'OCR-2',
+      amount: 3500,
+    });
+  });
+
+  it('should return no transactions for text that matches nothing', () => {
+    const samples = [
+      'Random text with no transactions at all',
+      'Page 1 of 3\nThank you for banking with us',
+      'Account summary\nOpening balance 100',
+    ];
+
+    for (const text of samples) {
+      expect(parseOCRText(text, 'bank')).toEqual([]);
+      expect(parseOCRText(text, 'creditcard')).toEqual([]);
+      expect(parseOCRText(text, 'ledger')).toEqual([]);
+      expect(parseOCRText(text, null)).toEqual([]);
+    }
+  });
+});
@@ -0,0 +1,234 @@
+/**
+ * Unit Tests for the OCR Service worker pool and blank page detection
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+interface FakeWorker {
+  terminated: boolean;
+}
+
+type WorkerLogger = (message: { status: string; progress: number }) => void;
+
+const state = vi.hoisted(() => ({
+  schedulers: [] as Array<{
+    workers: FakeWorker[];
+    addWorker: ReturnType<typeof vi.fn>;
+    addJob: ReturnType<typeof vi.fn>;
+    terminate: ReturnType<typeof vi.fn>;
+  }>,
+  workerLoggers: [] as WorkerLogger[],
+  // While set, recognition jobs stay pending until it resolves
+  jobGate: null as Promise<void> | null,
+}));
+
+vi.mock('tesseract.js', () => ({
+  OEM: { LSTM_ONLY: 1 },
+  createWorker: vi.fn(async (_lang: string, _oem: number, options: { logger: WorkerLogger }): Promise<FakeWorker> => {
+    state.workerLoggers.push(options.logger);
+    return { terminated: false };
+  }),
+  createScheduler: vi.fn(() => {
+    const workers: FakeWorker[] = [];
+    const scheduler = {
+      workers,
+      addWorker: vi.fn((worker: FakeWorker) => {
+        workers.push(worker);
+      }),
+      // Like tesseract.js, terminated workers stay registered and jobs sent to them fail
+      addJob: vi.fn(async () => {
+        if (state.jobGate) {
+          await state.jobGate;
+        }
+        const worker = workers[0];
+        if (!worker || worker.terminated) {
+          throw new Error('Worker has been terminated');
+        }
+        return { data: { text: 'recognised text', confidence: 90 } };
+      }),
+      terminate: vi.fn(async () => {
+        workers.forEach(worker => {
+          worker.terminated = true;
+        });
+      }),
+    };
+    state.schedulers.push(scheduler);
+    return scheduler;
+  }),
+}));
+
+vi.mock('pdfjs-dist', () => ({
+  GlobalWorkerOptions: { workerSrc: '' },
+  version: 'test',
+  getDocument: vi.fn(),
+}));
+
+// Pool idle timeout in ocrService
+const OCR_WORKER_IDLE_MS = 60 * 1000;
+
+const makeImageFile = (content: string): File => {
+  const file = new File([content], `${content}.png`, { type: 'image/png' });
+  Object.defineProperty(file, 'arrayBuffer', {
+    value: async () => new TextEncoder().encode(content).buffer,
+  });
+  return file;
+};
+
+describe('ocrService worker pool', () => {
+  beforeEach(() => {
+    state.schedulers.length = 0;
+    state.workerLoggers.length = 0;
+    state.jobGate = null;
+    vi.resetModules();
+    // Without SubtleCrypto the result cache is skipped, so every call reaches the scheduler
+    vi.stubGlobal('crypto', {});
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.unstubAllGlobals();
+  });
+
+  it('should keep recognising after the idle pool has been shut down', async () => {
+    vi.useFakeTimers();
+    const { processFileWithOCR } = await import('../services/ocrService');
+
+    const first = await processFileWithOCR(makeImageFile('first'));
+    expect(first.text).toBe('recognised text');
+
+    await vi.advanceTimersByTimeAsync(OCR_WORKER_IDLE_MS + 1);
+    expect(state.schedulers[0].terminate).toHaveBeenCalledTimes(1);
+
+    const second = await processFileWithOCR(makeImageFile('second'));
+    expect(second.text).toBe('recognised text');
+    expect(state.schedulers).toHaveLength(2);
+    expect(state.schedulers[1].addJob).toHaveBeenCalledTimes(1);
+  });
+
+  it('should forward worker progress while a single image job is running', async () => {
+    const { processFileWithOCR } = await import('../services/ocrService');
+    let openGate = () => {};
+    state.jobGate = new Promise<void>(resolve => {
+      openGate = resolve;
+    });
+
+    const onProgress = vi.fn();
+    const job = processFileWithOCR(makeImageFile('single'), onProgress);
+    await vi.waitFor(() => expect(state.schedulers[0].addJob).toHaveBeenCalledTimes(1));
+
+    state.workerLoggers[0]({ status: 'recognizing text', progress: 0.5 });
+    expect(onProgress).toHaveBeenCalledWith({ status: 'recognizing text', progress: 0.5 });
+
+    openGate();
+    await job;
+  });
+
+  it('should not leak worker progress into a callback while jobs overlap', async () => {
+    const { processFileWithOCR } = await import('../services/ocrService');
+    let openGate = () => {};
+    state.jobGate = new Promise<void>(resolve => {
+      openGate = resolve;
+    });
+
+    const firstProgress = vi.fn();
+    const secondProgress = vi.fn();
+    const first = processFileWithOCR(makeImageFile('first'), firstProgress);
+    const second = processFileWithOCR(makeImageFile('second'), secondProgress);
+    await vi.waitFor(() => expect(state.schedulers[0].addJob).toHaveBeenCalledTimes(2));
+
+    state.workerLoggers[0]({ status: 'recognizing text', progress: 0.5 });
+    expect(firstProgress).not.toHaveBeenCalledWith({ status: 'recognizing text', progress: 0.5 });
+    expect(secondProgress).not.toHaveBeenCalledWith({ status: 'recognizing text', progress: 0.5 });
+
+    openGate();
+    await Promise.all([first, second]);
+  });
+});
+
+interface FakeCanvas {
+  width: number;
+  height: number;
+  // Whether the canvas holds ink, and whether that ink is still dark once downscaled
+  ink: boolean;
+  inkSurvivesDownscale: boolean;
+  getImageData: ReturnType<typeof vi.fn>;
+  getContext: () => unknown;
+}
+
+const makeCanvas = (width: number, height: number, ink = false, inkSurvivesDownscale = true): FakeCanvas => {
+  const canvas: FakeCanvas = {
+    width,
+    height,
+    ink,
+    inkSurvivesDownscale,
+    getImageData: vi.fn((_x: number, _y: number, w: number, h: number) => {
+      const data = new Uint8ClampedArray(w * h * 4).fill(255);
+      if (canvas.ink) {
+        data.fill(0, 0, 3);
+      }
+      return { data };
+    }),
+    getContext: () => ({
+      getImageData: canvas.getImageData,
+      drawImage: (source: FakeCanvas) => {
+        canvas.ink = source.ink && source.inkSurvivesDownscale;
+      },
+    }),
+  };
+  return canvas;
+};
+
+describe('ocrService isBlankPage', () => {
+  let samples: FakeCanvas[];
+
+  beforeEach(() => {
+    samples = [];
+    const createElement = document.createElement.bind(document);
+    vi.spyOn(document, 'createElement').mockImplementation((tagName: string) => {
+      if (tagName !== 'canvas') {
+        return createElement(tagName);
+      }
+      const sample = makeCanvas(0, 0);
+      samples.push(sample);
+      return sample as unknown as HTMLCanvasElement;
+    });
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('should settle an inked page from the downscaled sample alone', async () => {
+    const { isBlankPage } = await import('../services/ocrService');
+    const page = makeCanvas(1200, 1600, true);
+
+    expect(isBlankPage(page as unknown as HTMLCanvasElement)).toBe(false);
+    expect(samples).toHaveLength(1);
+    expect(page.getImageData).not.toHaveBeenCalled();
+  });
+
+  it('should confirm a blank page at full resolution', async () => {
+    const { isBlankPage } = await import('../services/ocrService');
+    const page = makeCanvas(1200, 1600);
+
+    expect(isBlankPage(page as unknown as HTMLCanvasElement)).toBe(true);
+    expect(samples[0].getImageData).toHaveBeenCalledWith(0, 0, 192, 256);
+    expect(page.getImageData).toHaveBeenCalledWith(0, 0, 1200, 1600);
+  });
+
+  it('should still find faint ink that the downscaled sample lost', async () => {
+    const { isBlankPage } = await import('../services/ocrService');
+    const page = makeCanvas(1200, 1600, true, false);
+
+    expect(isBlankPage(page as unknown as HTMLCanvasElement)).toBe(false);
+    expect(page.getImageData).toHaveBeenCalledTimes(1);
+  });
+
+  it('should read small pages directly without a sample', async () => {
+    const { isBlankPage } = await import('../services/ocrService');
+    const page = makeCanvas(200, 100, true);
+
+    expect(isBlankPage(page as unknown as HTMLCanvasElement)).toBe(false);
+    expect(samples).toHaveLength(0);
+  });
+});
@@ -0,0 +1,35 @@
+/**
+ * Unit Tests for the Standard Chartered statement parser
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseStandardCharteredStatement } from '../services/parsers/standardCharteredParser';
+
+const metadata = {
+  bankName: 'Standard Chartered',
+  accountHolder: 'Jane Doe',
+  accountNumber: '',
+  statementPeriod: '',
+  currency: 'INR',
+};
+
+const HEADER_LINE = 'Date Value Date Description Cheque Deposit Withdrawal Balance';
+
+describe('parseStandardCharteredStatement', () => {
+  it('should match a dated row behind a list marker', () => {
+    const text = [HEADER_LINE, '1. 05 Jan 2024 05 Jan 2024 UPI PURCHASE GROCER 500.00 9,500.00'].join('\n');
+
+    const { transactions } = parseStandardCharteredStatement(text, metadata);
+
+    expect(transactions).toHaveLength(1);
+    expect(transactions[0].transactionDate).toBe('2024-01-05');
+  });
+
+  it('should skip rows that do not open with a day number', () => {
+    const text = [HEADER_LINE, 'Ref 05 Jan 2024 05 Jan 2024 UPI PURCHASE GROCER 500.00 9,500.00'].join('\n');
+
+    const { transactions } = parseStandardCharteredStatement(text, metadata);
+
+    expect(transactions).toHaveLength(0);
+  });
+});
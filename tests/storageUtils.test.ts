@@ -2,7 +2,7 @@
  * Unit Tests for Storage Utilities
  */
 
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach } from 'vitest';
 import {
   getStorageItem,
   setStorageItem,
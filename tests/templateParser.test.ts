@@ -0,0 +1,32 @@
+/**
+ * Unit Tests for the template-based statement parser
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseWithTemplateDetection } from '../services/templateParser';
+
+describe('parseWithTemplateDetection', () => {
+  it('should anchor indented day-month rows and stop at the section end', () => {
+    const text = [
+      'Account Statement',
+      '  05 Jan 2024 CAFE HUT 4.50',
+      '  12 Jan 2024 GREEN MART 52.10',
+      '  BALANCE CARRIED FORWARD',
+      '  31 Jan 2024 CLOSING BALANCE 1000.00',
+    ].join('\n');
+
+    const transactions = parseWithTemplateDetection(text);
+
+    expect(transactions).toHaveLength(2);
+    expect(transactions[0]).toMatchObject({
+      transactionDate: '2024-01-05',
+      description: 'CAFE HUT',
+      amount: 4.5,
+    });
+    expect(transactions[1]).toMatchObject({
+      transactionDate: '2024-01-12',
+      description: 'GREEN MART',
+      amount: 52.1,
+    });
+  });
+});
@@ -73,8 +73,8 @@ export const formatFileSize = (bytes: number): string => {
  * Get file extension
  */
 export const getFileExtension = (filename: string): string => {
-  const parts = filename.split('.');
-  return parts.length > 1 ? parts.pop()?.toLowerCase() || '' : '';
+  const dotIndex = filename.lastIndexOf('.');
+  return dotIndex === -1 ? '' : filename.slice(dotIndex + 1).toLowerCase();
 };
 
 /**
@@ -121,8 +121,8 @@ export const readFileAsDataURL = (file: File): Promise<string> => {
     const reader = new FileReader();
     reader.onload = () => {
       const result = reader.result as string;
-      // Remove data URL prefix to get base64 string
-      const base64 = result.split(',')[1];
+      // Remove data URL prefix to get base64 string without splitting the whole payload
+      const base64 = result.slice(result.indexOf(',') + 1);
       resolve(base64);
     };
     reader.onerror = () => reject(new Error('Failed to read file'));